@@ -0,0 +1,160 @@
+import argparse
+import random
+import sys
+import time
+
+from process import Process
+from algorithms import CPUScheduler
+from fast_algorithms import FastCPUScheduler
+
+REFERENCE = CPUScheduler
+
+# Every optimized engine must expose the same methods as CPUScheduler.
+# Register new ones here so they are checked against the reference.
+FAST_ENGINES = {
+    'heap': FastCPUScheduler
+}
+
+ALGORITHMS = ['fcfs', 'sjf_non_preemptive', 'sjf_preemptive', 'priority_scheduling', 'round_robin']
+
+
+def random_workload(rng, max_processes=12):
+    count = rng.randint(1, max_processes)
+    # Small value ranges so ties in arrival, burst and priority are common
+    max_arrival = rng.choice([0, 3, 10, 30])
+    max_burst = rng.choice([1, 3, 8, 15])
+
+    return [Process(pid, rng.randint(0, max_arrival), rng.randint(1, max_burst), rng.randint(1, 4))
+            for pid in range(1, count + 1)]
+
+
+def run(engine, algorithm, workload, context_switch_time, quantum):
+    scheduler = engine([Process(p.pid, p.arrival_time, p.burst_time, p.priority) for p in workload],
+                       context_switch_time)
+    if algorithm == 'round_robin':
+        metrics = scheduler.round_robin(quantum)
+    else:
+        metrics = getattr(scheduler, algorithm)()
+    return scheduler, metrics
+
+
+def snapshot(scheduler, metrics):
+    return {
+        'metrics': metrics,
+        'timeline': scheduler.timeline,
+        'processes': [(p.pid, p.start_time, p.completion_time, p.turnaround_time,
+                       p.waiting_time, p.remaining_time) for p in scheduler.processes]
+    }
+
+
+def check_case(rng, max_processes):
+    workload = random_workload(rng, max_processes)
+    context_switch_time = rng.choice([0, 0, 1, 2])
+    quantum = rng.randint(1, 4)
+    failures = []
+
+    for algorithm in ALGORITHMS:
+        expected = snapshot(*run(REFERENCE, algorithm, workload, context_switch_time, quantum))
+
+        for name, engine in FAST_ENGINES.items():
+            try:
+                actual = snapshot(*run(engine, algorithm, workload, context_switch_time, quantum))
+            except Exception as e:
+                failures.append((name, algorithm, 'exception', f"{type(e).__name__}: {e}",
+                                 workload, context_switch_time, quantum))
+                continue
+
+            for field in ('timeline', 'processes', 'metrics'):
+                if actual[field] != expected[field]:
+                    failures.append((name, algorithm, field, None, workload, context_switch_time, quantum))
+                    break
+
+    return failures
+
+
+def check(cases, seed, max_processes):
+    failures = []
+
+    for case in range(cases):
+        rng = random.Random(f"{seed}-{case}")
+        for failure in check_case(rng, max_processes):
+            failures.append((case,) + failure)
+
+    return failures
+
+
+def benchmark(num_processes, repeats, seed):
+    rng = random.Random(seed)
+    workload = [Process(pid, rng.randint(0, num_processes * 2), rng.randint(1, 10), rng.randint(1, 4))
+                for pid in range(1, num_processes + 1)]
+    results = {}
+
+    for algorithm in ALGORITHMS:
+        timings = {}
+        for name, engine in [('reference', REFERENCE)] + list(FAST_ENGINES.items()):
+            best = float('inf')
+            for _ in range(repeats):
+                start = time.perf_counter()
+                run(engine, algorithm, workload, 1, 2)
+                best = min(best, time.perf_counter() - start)
+            timings[name] = best
+        results[algorithm] = timings
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check fast scheduling engines against the reference CPUScheduler")
+    parser.add_argument('-n', '--cases', type=int, default=2000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--max-processes', type=int, default=12)
+    parser.add_argument('--bench-processes', type=int, default=2000)
+    parser.add_argument('--bench-repeats', type=int, default=3)
+    parser.add_argument('--no-bench', action='store_true')
+    args = parser.parse_args()
+
+    if args.cases < 1:
+        parser.error("cases must be at least 1")
+    if args.max_processes < 1:
+        parser.error("max-processes must be at least 1")
+    if args.bench_processes < 1:
+        parser.error("bench-processes must be at least 1")
+    if args.bench_repeats < 1:
+        parser.error("bench-repeats must be at least 1")
+
+    failures = check(args.cases, args.seed, args.max_processes)
+
+    print("\n" + "="*80)
+    print("DIFFERENTIAL CHECK")
+    print("="*80)
+    print(f"{args.cases} workloads x {len(ALGORITHMS)} algorithms x {len(FAST_ENGINES)} engine(s), seed={args.seed}")
+    if failures:
+        for case, name, algorithm, field, detail, workload, context_switch_time, quantum in failures[:10]:
+            print(f"MISMATCH case={case} engine={name} algorithm={algorithm} field={field} "
+                  f"context_switch={context_switch_time} quantum={quantum}")
+            if detail:
+                print(f"  error={detail}")
+            print(f"  workload={workload}")
+        print(f"{len(failures)} mismatch(es)")
+    else:
+        print("All engines match the reference")
+
+    if not args.no_bench:
+        results = benchmark(args.bench_processes, args.bench_repeats, args.seed)
+
+        print("\n" + "="*80)
+        print(f"SPEED vs REFERENCE ({args.bench_processes} processes, best of {args.bench_repeats})")
+        print("="*80)
+        print(f"{'Algorithm':<22} {'Engine':<10} {'Reference':>12} {'Engine':>12} {'Speedup':>10}")
+        print("-"*80)
+        for algorithm, timings in results.items():
+            for name in FAST_ENGINES:
+                print(f"{algorithm:<22} {name:<10} {timings['reference']*1000:>10.2f}ms "
+                      f"{timings[name]*1000:>10.2f}ms {timings['reference'] / timings[name]:>9.1f}x")
+        print("="*80)
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,157 @@
+import heapq
+from bisect import bisect_right
+from collections import deque
+from algorithms import CPUScheduler
+
+class FastCPUScheduler(CPUScheduler):
+    # Same results as CPUScheduler, but the ready set is kept in a heap keyed on
+    # (burst/priority, position in self.processes) instead of rescanning every
+    # process on each decision. The position keeps min()'s first-wins tie-breaking.
+
+    def _finish(self, process):
+        process.completion_time = self.current_time
+        process.turnaround_time = process.completion_time - process.arrival_time
+        process.waiting_time = process.turnaround_time - process.burst_time
+
+    def _non_preemptive(self, key):
+        self.reset_processes()
+        arrivals = sorted(range(len(self.processes)), key=lambda i: self.processes[i].arrival_time)
+        ready = []
+        next_index = 0
+        left = len(self.processes)
+
+        while left:
+            while next_index < len(arrivals) and self.processes[arrivals[next_index]].arrival_time <= self.current_time:
+                i = arrivals[next_index]
+                heapq.heappush(ready, (key(self.processes[i]), i))
+                next_index += 1
+
+            if not ready:
+                self.current_time = self.processes[arrivals[next_index]].arrival_time
+                continue
+
+            process = self.processes[heapq.heappop(ready)[1]]
+
+            if process.start_time == -1:
+                process.start_time = self.current_time
+
+            self.timeline.append({
+                'pid': process.pid,
+                'start': self.current_time,
+                'end': self.current_time + process.burst_time
+            })
+
+            self.current_time += process.burst_time
+            self._finish(process)
+
+            left -= 1
+            if left:
+                self.current_time += self.context_switch_time
+
+        return self.calculate_metrics()
+
+    def sjf_non_preemptive(self):
+        return self._non_preemptive(lambda p: p.burst_time)
+
+    def priority_scheduling(self):
+        return self._non_preemptive(lambda p: p.priority)
+
+    def sjf_preemptive(self):
+        # Mirrors the reference exactly: only never-started processes and the
+        # one currently held compete, and the held process loses ties.
+        self.reset_processes()
+        arrivals = sorted(range(len(self.processes)), key=lambda i: self.processes[i].arrival_time)
+        arrival_times = [self.processes[i].arrival_time for i in arrivals]
+        ready = []
+        next_index = 0
+        current_process = None
+
+        while next_index < len(arrivals) or ready or current_process:
+            while next_index < len(arrivals) and arrival_times[next_index] <= self.current_time:
+                i = arrivals[next_index]
+                heapq.heappush(ready, (self.processes[i].remaining_time, i))
+                next_index += 1
+
+            if ready and (current_process is None or ready[0][0] <= current_process.remaining_time):
+                process = self.processes[heapq.heappop(ready)[1]]
+            elif current_process:
+                process = current_process
+            else:
+                self.current_time = arrival_times[next_index]
+                continue
+
+            if current_process and current_process is not process:
+                if self.context_switch_time > 0:
+                    self.current_time += self.context_switch_time
+
+            if process.start_time == -1:
+                process.start_time = self.current_time
+
+            upcoming = bisect_right(arrival_times, self.current_time, next_index)
+            if upcoming < len(arrival_times):
+                execute_time = min(process.remaining_time, arrival_times[upcoming] - self.current_time)
+            else:
+                execute_time = process.remaining_time
+
+            self.timeline.append({
+                'pid': process.pid,
+                'start': self.current_time,
+                'end': self.current_time + execute_time
+            })
+
+            self.current_time += execute_time
+            process.remaining_time -= execute_time
+
+            if process.remaining_time == 0:
+                self._finish(process)
+                current_process = None
+            else:
+                current_process = process
+
+        return self.calculate_metrics()
+
+    def round_robin(self, time_quantum=2):
+        self.reset_processes()
+        ready_queue = deque()
+        remaining = sorted(self.processes, key=lambda x: x.arrival_time)
+        next_index = 0
+
+        while next_index < len(remaining) and remaining[next_index].arrival_time <= self.current_time:
+            ready_queue.append(remaining[next_index])
+            next_index += 1
+
+        while ready_queue or next_index < len(remaining):
+            if not ready_queue:
+                self.current_time = remaining[next_index].arrival_time
+                ready_queue.append(remaining[next_index])
+                next_index += 1
+
+            process = ready_queue.popleft()
+
+            if process.start_time == -1:
+                process.start_time = self.current_time
+
+            execute_time = min(time_quantum, process.remaining_time)
+
+            self.timeline.append({
+                'pid': process.pid,
+                'start': self.current_time,
+                'end': self.current_time + execute_time
+            })
+
+            self.current_time += execute_time
+            process.remaining_time -= execute_time
+
+            while next_index < len(remaining) and remaining[next_index].arrival_time <= self.current_time:
+                ready_queue.append(remaining[next_index])
+                next_index += 1
+
+            if process.remaining_time == 0:
+                self._finish(process)
+            else:
+                ready_queue.append(process)
+
+            if ready_queue or next_index < len(remaining):
+                self.current_time += self.context_switch_time
+
+        return self.calculate_metrics()
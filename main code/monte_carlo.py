@@ -0,0 +1,235 @@
+import argparse
+import csv
+import math
+import random
+import time
+from multiprocessing import Pool, cpu_count
+from statistics import NormalDist
+
+from process import Process
+from algorithms import CPUScheduler
+
+POLICIES = {
+    'FCFS': 'fcfs',
+    'SJF (NP)': 'sjf_non_preemptive',
+    'SJF (P)': 'sjf_preemptive',
+    'Priority': 'priority_scheduling',
+    'Round Robin': 'round_robin'
+}
+
+METRICS = ('TAT', 'WT', 'RT')
+
+DEFAULT_PARAMS = {
+    'min_processes': 5,
+    'max_processes': 20,
+    'arrival_rate': 0.5,
+    'burst_dist': 'exponential',
+    'mean_burst': 5,
+    'max_burst': 20,
+    'priority_weights': {1: 0.2, 2: 0.5, 3: 0.3}
+}
+
+
+def generate_workload(rng, params):
+    count = rng.randint(params['min_processes'], params['max_processes'])
+    priorities = list(params['priority_weights'])
+    weights = list(params['priority_weights'].values())
+
+    processes = []
+    arrival = 0.0
+    for pid in range(1, count + 1):
+        if pid > 1:
+            arrival += rng.expovariate(params['arrival_rate'])
+
+        if params['burst_dist'] == 'uniform':
+            burst = rng.randint(1, params['max_burst'])
+        else:
+            burst = round(rng.expovariate(1 / params['mean_burst']))
+            burst = min(max(burst, 1), params['max_burst'])
+
+        priority = rng.choices(priorities, weights)[0]
+        processes.append(Process(pid, int(arrival), burst, priority))
+
+    return processes
+
+
+def simulate_workload(processes, quantum=2, context_switch_time=0):
+    results = {}
+
+    for name, method in POLICIES.items():
+        scheduler = CPUScheduler([Process(p.pid, p.arrival_time, p.burst_time, p.priority)
+                                  for p in processes], context_switch_time)
+        if method == 'round_robin':
+            avg_tat, avg_wt = scheduler.round_robin(quantum)
+        else:
+            avg_tat, avg_wt = getattr(scheduler, method)()
+
+        avg_rt = sum(p.start_time - p.arrival_time for p in scheduler.processes) / len(scheduler.processes)
+        # A process that never finished keeps completion_time = 0 but is still
+        # averaged by calculate_metrics, so flag the run instead of trusting it
+        valid = all(p.completion_time >= p.arrival_time + p.burst_time for p in scheduler.processes)
+        results[name] = {'TAT': avg_tat, 'WT': avg_wt, 'RT': avg_rt, 'valid': valid}
+
+    return results
+
+
+def simulate_batch(batch):
+    start, count, seed, params, quantum, context_switch_time = batch
+    rows = []
+
+    for workload in range(start, start + count):
+        # Every workload gets its own seed so results do not depend on batching
+        rng = random.Random(f"{seed}-{workload}")
+        processes = generate_workload(rng, params)
+        results = simulate_workload(processes, quantum, context_switch_time)
+
+        for name, metrics in results.items():
+            rows.append((workload, name, len(processes), metrics['TAT'], metrics['WT'], metrics['RT'],
+                         int(metrics['valid'])))
+
+    return rows
+
+
+class RunningStats:
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def add(self, value):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def confidence_interval(self, confidence=0.95):
+        if self.count == 0:
+            return None
+        if self.count < 2:
+            return self.mean, self.mean
+
+        z = NormalDist().inv_cdf(0.5 + confidence / 2)
+        half_width = z * math.sqrt(self.m2 / (self.count - 1)) / math.sqrt(self.count)
+        return self.mean - half_width, self.mean + half_width
+
+
+def run_monte_carlo(num_workloads, output_path, params=None, quantum=2, context_switch_time=0,
+                    seed=0, batch_size=100, workers=None):
+    params = {**DEFAULT_PARAMS, **(params or {})}
+    workers = workers or cpu_count()
+
+    batches = [(start, min(batch_size, num_workloads - start), seed, params, quantum, context_switch_time)
+               for start in range(0, num_workloads, batch_size)]
+
+    stats = {name: {metric: RunningStats() for metric in METRICS} for name in POLICIES}
+    invalid = {name: 0 for name in POLICIES}
+
+    with open(output_path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['workload', 'algorithm', 'processes', 'avg_tat', 'avg_wt', 'avg_rt', 'valid'])
+
+        with Pool(workers) as pool:
+            for rows in pool.imap_unordered(simulate_batch, batches):
+                writer.writerows(rows)
+                f.flush()
+
+                for _, name, _, avg_tat, avg_wt, avg_rt, valid in rows:
+                    if not valid:
+                        invalid[name] += 1
+                        continue
+                    stats[name]['TAT'].add(avg_tat)
+                    stats[name]['WT'].add(avg_wt)
+                    stats[name]['RT'].add(avg_rt)
+
+    return stats, invalid
+
+
+def print_summary(stats, invalid, confidence=0.95):
+    print("\n" + "="*80)
+    print(f"MONTE CARLO SUMMARY ({confidence:.0%} confidence intervals)")
+    print("="*80)
+    print(f"{'Algorithm':<14} {'Avg TAT':>20} {'Avg WT':>20} {'Avg RT':>20}")
+    print("-"*80)
+    for name, metrics in stats.items():
+        cells = []
+        for metric in METRICS:
+            interval = metrics[metric].confidence_interval(confidence)
+            if invalid[name] or interval is None:
+                cells.append("n/a")
+                continue
+            low, high = interval
+            cells.append(f"{metrics[metric].mean:.2f} [{low:.2f}, {high:.2f}]")
+        print(f"{name:<14} {cells[0]:>20} {cells[1]:>20} {cells[2]:>20}")
+    print("="*80)
+
+    for name, count in invalid.items():
+        if count:
+            total = count + stats[name]['TAT'].count
+            print(f"WARNING: {name} left processes unfinished in {count} of {total} workloads; "
+                  f"its results are excluded (see the 'valid' column in the CSV)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Monte Carlo evaluation of the CPU scheduling algorithms")
+    parser.add_argument('-n', '--workloads', type=int, default=10000)
+    parser.add_argument('-o', '--output', default='monte_carlo_results.csv')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--batch-size', type=int, default=100)
+    parser.add_argument('--quantum', type=int, default=2)
+    parser.add_argument('--context-switch', type=int, default=0)
+    parser.add_argument('--min-processes', type=int, default=DEFAULT_PARAMS['min_processes'])
+    parser.add_argument('--max-processes', type=int, default=DEFAULT_PARAMS['max_processes'])
+    parser.add_argument('--arrival-rate', type=float, default=DEFAULT_PARAMS['arrival_rate'],
+                        help="mean arrivals per time unit")
+    parser.add_argument('--burst-dist', choices=['exponential', 'uniform'], default=DEFAULT_PARAMS['burst_dist'])
+    parser.add_argument('--mean-burst', type=float, default=DEFAULT_PARAMS['mean_burst'])
+    parser.add_argument('--max-burst', type=int, default=DEFAULT_PARAMS['max_burst'])
+    parser.add_argument('--priority-weights', type=float, nargs='+', default=None,
+                        help="relative weight of priority 1, 2, 3, ...")
+    parser.add_argument('--confidence', type=float, default=0.95)
+    args = parser.parse_args()
+
+    if args.workloads < 1:
+        parser.error("workloads must be at least 1")
+    if args.quantum < 1:
+        parser.error("quantum must be at least 1")
+    if args.context_switch < 0:
+        parser.error("context-switch must not be negative")
+    if args.min_processes < 1 or args.max_processes < args.min_processes:
+        parser.error("process counts must satisfy 1 <= min-processes <= max-processes")
+    if args.arrival_rate <= 0 or args.mean_burst <= 0:
+        parser.error("arrival-rate and mean-burst must be positive")
+    if args.max_burst < 1:
+        parser.error("max-burst must be at least 1")
+    if args.batch_size < 1:
+        parser.error("batch-size must be at least 1")
+    if args.workers is not None and args.workers < 1:
+        parser.error("workers must be at least 1")
+    if not 0 < args.confidence < 1:
+        parser.error("confidence must be between 0 and 1, e.g. 0.95")
+    if args.priority_weights and (min(args.priority_weights) < 0 or not any(args.priority_weights)):
+        parser.error("priority-weights must be non-negative and not all zero")
+
+    params = {
+        'min_processes': args.min_processes,
+        'max_processes': args.max_processes,
+        'arrival_rate': args.arrival_rate,
+        'burst_dist': args.burst_dist,
+        'mean_burst': args.mean_burst,
+        'max_burst': args.max_burst
+    }
+    if args.priority_weights:
+        params['priority_weights'] = {i: w for i, w in enumerate(args.priority_weights, start=1)}
+
+    start = time.perf_counter()
+    stats, invalid = run_monte_carlo(args.workloads, args.output, params, args.quantum, args.context_switch,
+                            args.seed, args.batch_size, args.workers)
+    elapsed = time.perf_counter() - start
+
+    print_summary(stats, invalid, args.confidence)
+    print(f"{args.workloads} workloads x {len(POLICIES)} algorithms in {elapsed:.1f}s -> {args.output}")
+
+
+if __name__ == "__main__":
+    main()